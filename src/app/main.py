@@ -1,39 +1,129 @@
 """FastAPI application for alert term extraction."""
 
+import asyncio
 import multiprocessing
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from app.utils import extraction_worker
+from app.utils import STATUS_RUNNING, extraction_worker
+from config.log_writer import log_writer_process
 from config.logger import logger
 from models.api import ExtractionRequest, ExtractionResponse
 
+if TYPE_CHECKING:
+    from multiprocessing.sharedctypes import Synchronized
+
 # Constants for process management
 GRACEFUL_SHUTDOWN_TIMEOUT = 5  # seconds
 FORCEFUL_TERMINATION_TIMEOUT = 2  # seconds
 
-# Global variables to track the extraction process
-extraction_process: Optional[multiprocessing.Process] = None
+# Global handles for the persistent worker process and its IPC channels.
+# The worker is spawned once at startup; start/stop/status are driven by
+# queue commands and shared flags instead of process lifecycle, so repeated
+# start/stop cycles reuse the already-imported interpreter and API clients.
+_worker_proc: Optional[multiprocessing.Process] = None
+_cmd_queue: Optional[multiprocessing.Queue] = None
+_status_value: Optional["Synchronized"] = None
 should_stop = multiprocessing.Event()
 
+# The extracted-alerts JSONL file is owned by a dedicated writer process that
+# drains pre-serialized records from this queue, so file I/O never competes
+# with the extraction loop for CPU.
+_writer_proc: Optional[multiprocessing.Process] = None
+_jsonl_queue: Optional[multiprocessing.Queue] = None
+
 app = FastAPI(
     title="Alert Term Extraction API",
     description="API for starting and stopping alert term extraction processes",
     version="1.0.0",
+    # orjson encodes responses (datetimes included) in C, which matters most
+    # for frequently polled endpoints like /extraction-status
+    default_response_class=ORJSONResponse,
 )
 
 
+@app.on_event("startup")
+async def start_worker():
+    """Spawn the persistent worker and log writer processes with their IPC channels."""
+    global _worker_proc, _cmd_queue, _status_value, _writer_proc, _jsonl_queue
+
+    _jsonl_queue = multiprocessing.Queue()
+    _writer_proc = multiprocessing.Process(
+        target=log_writer_process,
+        args=(_jsonl_queue,),
+        daemon=True,
+    )
+    _writer_proc.start()
+
+    _cmd_queue = multiprocessing.Queue()
+    _status_value = multiprocessing.Value("i", 0)
+    _worker_proc = multiprocessing.Process(
+        target=extraction_worker,
+        args=(_cmd_queue, should_stop, _status_value, _jsonl_queue),
+        daemon=True,
+    )
+    _worker_proc.start()
+
+    logger.info(
+        f"Started persistent extraction worker (PID: {_worker_proc.pid}) "
+        f"and log writer (PID: {_writer_proc.pid})"
+    )
+
+
+@app.on_event("shutdown")
+async def stop_worker():
+    """Shut down the persistent extraction worker and log writer gracefully."""
+    global _worker_proc, _writer_proc
+
+    if _worker_proc is None:
+        return
+
+    # Stop any running extraction and ask the worker to exit its command loop.
+    # All joins are offloaded to threads so the event loop (and e.g. /health)
+    # stays responsive while processes wind down.
+    should_stop.set()
+    _cmd_queue.put({"action": "shutdown"})
+
+    await asyncio.to_thread(_worker_proc.join, GRACEFUL_SHUTDOWN_TIMEOUT)
+
+    if _worker_proc.is_alive():
+        # Force terminate if it doesn't stop gracefully
+        logger.warning("Extraction worker didn't stop gracefully, terminating...")
+        _worker_proc.terminate()
+        await asyncio.to_thread(_worker_proc.join, FORCEFUL_TERMINATION_TIMEOUT)
+
+        if _worker_proc.is_alive():
+            # Kill if terminate doesn't work
+            logger.error("Forcefully killing extraction worker")
+            _worker_proc.kill()
+            await asyncio.to_thread(_worker_proc.join)
+
+    logger.info("Extraction worker stopped successfully")
+    _worker_proc = None
+
+    # Stop the log writer after the worker so no records are lost
+    if _writer_proc is not None:
+        _jsonl_queue.put(None)
+        await asyncio.to_thread(_writer_proc.join, GRACEFUL_SHUTDOWN_TIMEOUT)
+        if _writer_proc.is_alive():
+            logger.warning("Log writer didn't stop gracefully, terminating...")
+            _writer_proc.terminate()
+            await asyncio.to_thread(_writer_proc.join, FORCEFUL_TERMINATION_TIMEOUT)
+        _writer_proc = None
+
+
 @app.post(
     "/start-extraction", response_model=ExtractionResponse, tags=["Extraction Process"]
 )
 async def start_extraction(request: ExtractionRequest):
     """
-    Start the alert term extraction process in the background.
+    Start the alert term extraction loop in the background worker.
 
-    Validates that no other extraction process is currently running.
-    Initializes and starts a new process for term extraction.
+    Validates that no extraction run is currently active, then sends a start
+    command to the persistent worker process.
 
     Args:
         request: An `ExtractionRequest` containing:
@@ -42,38 +132,43 @@ async def start_extraction(request: ExtractionRequest):
                                         If None, runs indefinitely.
 
     Returns:
-        An `ExtractionResponse` with a success message and the process ID.
+        An `ExtractionResponse` with a success message and the worker process ID.
 
     Raises:
-        HTTPException (400): If an extraction process is already running.
-        HTTPException (500): If there is an internal error starting the process.
+        HTTPException (400): If an extraction run is already active.
+        HTTPException (500): If the worker process is unavailable or the start fails.
     """
-    global extraction_process, should_stop
+    if _worker_proc is None or not _worker_proc.is_alive():
+        raise HTTPException(
+            status_code=500, detail="Extraction worker process is not available."
+        )
 
     # Check if extraction is already running
-    if extraction_process is not None and extraction_process.is_alive():
+    if _status_value.value == STATUS_RUNNING:
         raise HTTPException(
             status_code=400,
             detail="Extraction process is already running. Stop it first before starting a new one.",
         )
 
     try:
-        # Reset the stop event
+        # Reset the stop event and dispatch the start command to the worker
         should_stop.clear()
-
-        # Create and start the extraction process
-        extraction_process = multiprocessing.Process(
-            target=extraction_worker,
-            args=(request.frequency_ms, request.total_checks, should_stop),
+        _cmd_queue.put(
+            {
+                "action": "start",
+                "frequency_ms": request.frequency_ms,
+                "total_checks": request.total_checks,
+            }
         )
-        extraction_process.start()
+        # Mark as running immediately so back-to-back starts are rejected
+        _status_value.value = STATUS_RUNNING
 
-        logger.info(f"Started extraction process with PID: {extraction_process.pid}")
+        logger.info(f"Dispatched start command to worker PID: {_worker_proc.pid}")
 
         total_checks_msg = request.total_checks or "infinite"
         return ExtractionResponse(
             message=f"Extraction started with frequency {request.frequency_ms}ms and {total_checks_msg} checks",
-            process_id=extraction_process.pid,
+            process_id=_worker_proc.pid,
         )
 
     except Exception as e:
@@ -88,53 +183,37 @@ async def start_extraction(request: ExtractionRequest):
 )
 async def stop_extraction():
     """
-    Stop the currently running alert term extraction process.
+    Stop the currently running alert term extraction loop.
 
-    Signals the background process to stop gracefully. If it does not respond
-    within a timeout, it will be forcefully terminated.
+    Signals the background worker to stop its current run. The worker process
+    itself stays alive, waiting for the next start command.
 
     Returns:
         An `ExtractionResponse` with a success message.
 
     Raises:
-        HTTPException (400): If no extraction process is currently running.
-        HTTPException (500): If there is an internal error stopping the process.
+        HTTPException (400): If no extraction run is currently active.
+        HTTPException (500): If there is an internal error stopping the run.
     """
-    global extraction_process, should_stop
-
     # Check if extraction is running
-    if extraction_process is None or not extraction_process.is_alive():
+    if (
+        _worker_proc is None
+        or not _worker_proc.is_alive()
+        or _status_value.value != STATUS_RUNNING
+    ):
         raise HTTPException(
             status_code=400, detail="No extraction process is currently running."
         )
 
     try:
-        # Get the process ID before stopping
-        pid = extraction_process.pid
-
-        # Signal the process to stop
+        # Signal the worker to stop its current run
         should_stop.set()
 
-        # Wait for the process to finish gracefully (up to 5 seconds)
-        extraction_process.join(timeout=GRACEFUL_SHUTDOWN_TIMEOUT)
-
-        if extraction_process.is_alive():
-            # Force terminate if it doesn't stop gracefully
-            logger.warning("Extraction process didn't stop gracefully, terminating...")
-            extraction_process.terminate()
-            extraction_process.join(timeout=FORCEFUL_TERMINATION_TIMEOUT)
-
-            if extraction_process.is_alive():
-                # Kill if terminate doesn't work
-                logger.error("Forcefully killing extraction process")
-                extraction_process.kill()
-                extraction_process.join()
-
-        logger.info("Extraction process stopped successfully")
-        extraction_process = None
+        logger.info("Extraction run stop requested")
 
         return ExtractionResponse(
-            message="Extraction process stopped successfully", process_id=pid
+            message="Extraction process stopped successfully",
+            process_id=_worker_proc.pid,
         )
 
     except Exception as e:
@@ -147,30 +226,28 @@ async def stop_extraction():
 @app.get("/extraction-status", tags=["Extraction Process"])
 async def get_extraction_status():
     """
-    Get the current status of the alert term extraction process.
+    Get the current status of the alert term extraction loop.
 
-    Checks if the background process is alive and returns its status.
+    Reads the shared status flag maintained by the persistent worker process.
 
     Returns:
         A dictionary containing the status (`running` or `stopped`),
-        the process ID (if running), and a descriptive message.
+        the worker process ID (if running), and a descriptive message.
     """
-    global extraction_process
-
-    if extraction_process is None:
+    if _worker_proc is None or not _worker_proc.is_alive():
         return {
             "status": "stopped",
-            "message": "No extraction process has been started",
+            "message": "Extraction worker process is not available",
         }
 
-    is_alive = extraction_process.is_alive()
+    is_running = _status_value.value == STATUS_RUNNING
 
     return {
-        "status": "running" if is_alive else "stopped",
-        "process_id": extraction_process.pid if is_alive else None,
+        "status": "running" if is_running else "stopped",
+        "process_id": _worker_proc.pid if is_running else None,
         "message": "Extraction is running"
-        if is_alive
-        else "Extraction process has stopped",
+        if is_running
+        else "Extraction worker is idle",
     }
 
 
@@ -1,43 +1,231 @@
 """Utility functions for the FastAPI application."""
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+import hashlib
+import time
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+
+import orjson
 
 from clients.AlertTermsClient import AlertTermsClient
 from clients.AlertTextClient import AlertTextClient
+from clients.http import aclose_async_client
 from config.logger import logger
-from extraction.utils import find_term_matches
+from extraction.utils import find_term_matches_async
+from models.extraction import LogEntry
 
 if TYPE_CHECKING:
+    import multiprocessing
+    from multiprocessing.sharedctypes import Synchronized
     from multiprocessing.synchronize import Event
 
+# Worker status codes shared with the API process through a `multiprocessing.Value`
+STATUS_IDLE = 0
+STATUS_RUNNING = 1
+
+
+# Single-slot caches of the serialized alert/term payload bytes and their
+# content hashes. The source object is held in the slot so payloads unchanged
+# across consecutive checks (e.g. a cached terms fetch) are serialized once.
+_alerts_json_cache: Optional[Tuple[object, bytes, str]] = None
+_terms_json_cache: Optional[Tuple[object, bytes, str]] = None
+
+# Content hashes of payloads already written to the JSONL sink. Per-check
+# records reference payloads by hash instead of embedding them, which cuts
+# steady-state bytes written by orders of magnitude. The set is bounded:
+# alert payloads change on nearly every check, so a long-running worker
+# would otherwise grow it without limit. Resetting it merely re-emits the
+# next payload records, which is harmless — readers resolve payloads by
+# hash, so duplicates are redundant but never wrong.
+_seen_payload_hashes: Set[str] = set()
+_SEEN_PAYLOAD_HASHES_MAX = 4096
+
+
+def _payload_json_and_hash(
+    payload, cache: Optional[Tuple[object, bytes, str]]
+) -> Tuple[object, bytes, str]:
+    """
+    Serialize a payload model with orjson and hash it, reusing the cache slot.
+
+    Args:
+        payload: The `AlertList` or `QueryTermList` to serialize.
+        cache: The previous cache slot for this payload kind, if any.
+
+    Returns:
+        The new cache slot: (payload object, JSON bytes, content hash).
+    """
+    if cache is not None and cache[0] is payload:
+        return cache
+
+    body = orjson.dumps(payload.model_dump(mode="json"))
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return (payload, body, digest)
+
+
+def _serialize_log_records(log_entry: LogEntry) -> List[bytes]:
+    """
+    Serialize a `LogEntry` into one or more JSONL records.
+
+    Payloads are logged in full only the first time their content hash is
+    seen, as separate `{"type": "payload", ...}` records; the per-check match
+    record then references them by hash. Consecutive checks with identical
+    payloads therefore only pay for the (small) match list.
+
+    Args:
+        log_entry: The `LogEntry` to serialize.
+
+    Returns:
+        The JSON-encoded records to append to the extracted-alerts log,
+        in write order.
+    """
+    global _alerts_json_cache, _terms_json_cache
+
+    _alerts_json_cache = _payload_json_and_hash(
+        log_entry.alert_text_data, _alerts_json_cache
+    )
+    _terms_json_cache = _payload_json_and_hash(
+        log_entry.alert_query_term_data, _terms_json_cache
+    )
+
+    records: List[bytes] = []
+    for kind, (_, body, digest) in (
+        ("alert_text", _alerts_json_cache),
+        ("alert_query_term", _terms_json_cache),
+    ):
+        if digest not in _seen_payload_hashes:
+            if len(_seen_payload_hashes) >= _SEEN_PAYLOAD_HASHES_MAX:
+                _seen_payload_hashes.clear()
+            _seen_payload_hashes.add(digest)
+            records.append(
+                b'{"type":"payload","kind":"'
+                + kind.encode("ascii")
+                + b'","hash":"'
+                + digest.encode("ascii")
+                + b'","body":'
+                + body
+                + b"}"
+            )
+
+    matches_json = orjson.dumps(
+        [{"alert_id": m.alert_id, "term_id": m.term_id} for m in log_entry.matches]
+    )
+    records.append(
+        b'{"created_at":'
+        + orjson.dumps(log_entry.created_at)
+        + b',"alert_text_hash":"'
+        + _alerts_json_cache[2].encode("ascii")
+        + b'","alert_query_term_hash":"'
+        + _terms_json_cache[2].encode("ascii")
+        + b'","matches":'
+        + matches_json
+        + b"}"
+    )
+    return records
+
 
 def extraction_worker(
+    cmd_queue: "multiprocessing.Queue",
+    stop_event: "Event",
+    status_value: "Synchronized",
+    jsonl_queue: "multiprocessing.Queue",
+):
+    """
+    Long-lived worker process that runs alert term extraction on demand.
+
+    The worker is spawned once at application startup and blocks on `cmd_queue`
+    for commands. A `{"action": "start", ...}` message runs the extraction loop
+    until the stop event is set or the requested number of checks is reached,
+    after which the worker returns to waiting on the queue. A
+    `{"action": "shutdown"}` message terminates the worker. Keeping the process
+    (and its API clients) alive across start/stop cycles avoids paying the
+    interpreter import and client setup cost on every start.
+
+    Args:
+        cmd_queue: A `multiprocessing.Queue` delivering command dictionaries.
+        stop_event: A `multiprocessing.Event` used to signal when to stop a run.
+        status_value: A shared `multiprocessing.Value` reflecting the worker
+                      status (`STATUS_IDLE` or `STATUS_RUNNING`).
+        jsonl_queue: A `multiprocessing.Queue` consumed by the dedicated log
+                     writer process; receives serialized match records.
+    """
+    # Create API clients once, initializer-style; they are reused across all
+    # extraction runs so no start command pays client or connection setup.
+    try:
+        terms_api_client = AlertTermsClient()
+        alert_api_client = AlertTextClient()
+    except Exception as e:
+        logger.error(f"Extraction worker failed to initialize API clients: {e}")
+        raise
+
+    logger.info("Extraction worker started and waiting for commands")
+
+    while True:
+        command = cmd_queue.get()
+        action = command.get("action")
+
+        if action == "shutdown":
+            logger.info("Extraction worker shutting down")
+            # Release the sync clients' keep-alive pools with the worker
+            alert_api_client.close()
+            terms_api_client.close()
+            break
+
+        if action != "start":
+            logger.warning(f"Ignoring unknown worker command: {command}")
+            continue
+
+        status_value.value = STATUS_RUNNING
+        try:
+            asyncio.run(
+                _run_extraction_loop(
+                    command["frequency_ms"],
+                    command.get("total_checks"),
+                    alert_api_client,
+                    terms_api_client,
+                    stop_event,
+                    jsonl_queue,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error in extraction worker: {e}")
+        finally:
+            status_value.value = STATUS_IDLE
+
+
+async def _run_extraction_loop(
     frequency_ms: int,
     total_checks: Optional[int],
+    alert_api_client: AlertTextClient,
+    terms_api_client: AlertTermsClient,
     stop_event: "Event",
+    jsonl_queue: "multiprocessing.Queue",
 ):
     """
-    Worker function that runs the alert term extraction process.
+    Run the periodic extraction loop until stopped or the check limit is hit.
 
-    This function is designed to be executed in a separate process. It periodically
-    fetches alert texts and a list of terms, then searches for matches.
+    The loop runs inside its own event loop so both API feeds can be fetched
+    concurrently on every check while reusing keep-alive connections.
 
     Args:
         frequency_ms: The interval in milliseconds between each extraction check.
         total_checks: The total number of checks to perform. If None, it runs indefinitely.
-        stop_event: A `multiprocessing.Event` used to signal when to stop the worker.
+        alert_api_client: The `AlertTextClient` used to fetch alerts.
+        terms_api_client: The `AlertTermsClient` used to fetch query terms.
+        stop_event: A `multiprocessing.Event` used to signal when to stop the loop.
+        jsonl_queue: A `multiprocessing.Queue` consumed by the dedicated log
+                     writer process; receives serialized match records.
     """
     logger.info(
-        f"Starting extraction worker with frequency {frequency_ms}ms, total_checks: {total_checks or 'infinite'}"
+        f"Starting extraction run with frequency {frequency_ms}ms, total_checks: {total_checks or 'infinite'}"
     )
 
-    # Create API clients
-    terms_api_client = AlertTermsClient()
-    alert_api_client = AlertTextClient()
-
     check_count = 0
     frequency_seconds = frequency_ms / 1000.0
 
+    # Schedule checks at a fixed cadence from a monotonic start time, so the
+    # effective rate does not drift by the duration of each extraction.
+    start_time = time.monotonic()
+
     try:
         while not stop_event.is_set():
             # Check if we've reached the total number of checks
@@ -46,25 +234,42 @@ def extraction_worker(
                 break
 
             try:
-                # Perform the extraction with the API clients
-                log_entry = find_term_matches(alert_api_client, terms_api_client)
+                # Perform the extraction, fetching both feeds concurrently
+                log_entry = await find_term_matches_async(
+                    alert_api_client, terms_api_client
+                )
                 logger.info(
                     f"Check {check_count + 1}/{total_checks or '∞'}: Found {len(log_entry.matches)} matches"
                 )
 
                 if log_entry.matches:
-                    logger.bind(extracted_alert=True).info(log_entry.model_dump_json())
+                    # The writer process owns all JSONL formatting and file I/O;
+                    # the hot loop only pays for the queue put of ready bytes.
+                    for record in _serialize_log_records(log_entry):
+                        jsonl_queue.put(record + b"\n")
 
             except Exception as e:
                 logger.error(f"Error during extraction check: {e}")
 
             check_count += 1
 
-            # Wait for the specified frequency or until stop event is set
-            if stop_event.wait(timeout=frequency_seconds):
+            # Wait until the next deadline or until the stop event is set. A zero
+            # wait means extraction takes longer than the period: checks then run
+            # back-to-back instead of sleeping on top of the extraction time.
+            wait_seconds = max(
+                0.0, start_time + check_count * frequency_seconds - time.monotonic()
+            )
+            if wait_seconds == 0.0:
+                logger.warning(
+                    f"Check {check_count} exceeded the {frequency_ms}ms frequency; running at full tilt"
+                )
+            if await asyncio.to_thread(stop_event.wait, wait_seconds):
                 break
 
-    except Exception as e:
-        logger.error(f"Unexpected error in extraction worker: {e}")
     finally:
-        logger.info(f"Extraction worker stopped after {check_count} checks")
+        # The shared async client is bound to this run's event loop; close it
+        # before `asyncio.run` tears the loop down so its pooled sockets are
+        # released instead of leaked once per start/stop cycle.
+        await aclose_async_client()
+
+    logger.info(f"Extraction run stopped after {check_count} checks")
@@ -1,7 +1,13 @@
-import requests
+from typing import Dict, Optional
 
+import httpx
+import msgspec
+import orjson
+
+from clients.http import DEFAULT_LIMITS, get_async_client
 from config.settings import settings
 from models.query_terms import QueryTermList
+from models.schemas_fast import decode_terms
 
 
 class AlertTermsClient:
@@ -9,7 +15,8 @@ class AlertTermsClient:
     Client to fetch alert query terms from the Prewave API.
 
     This client handles the communication with the alert terms API,
-    including authentication and data validation.
+    including authentication and data validation. A keep-alive connection
+    pool is shared across calls so repeated fetches reuse the same socket.
     """
 
     def __init__(self, timeout: int = 10):
@@ -27,6 +34,17 @@ class AlertTermsClient:
         self.base_url = settings.alert_terms_api_url
         self.api_key = settings.alert_api_key
         self.timeout = timeout
+        self._client = httpx.Client(timeout=timeout, limits=DEFAULT_LIMITS)
+
+        # Conditional-GET state: terms change rarely, so a 304 Not Modified
+        # lets us skip the body download, JSON parse and model construction.
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cached: Optional[QueryTermList] = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its keep-alive connections."""
+        self._client.close()
 
     def fetch_terms(self) -> QueryTermList:
         """
@@ -36,16 +54,100 @@ class AlertTermsClient:
             A `QueryTermList` object containing the validated query terms.
 
         Raises:
-            requests.RequestException: If the API request fails.
+            httpx.HTTPError: If the API request fails.
+            ValidationError: If the API response is not a valid list of terms.
+            ValueError: If the API response is not in the expected format.
+        """
+        url = f"{self.base_url}?key={self.api_key}"
+        response = self._client.get(url, headers=self._conditional_headers())
+        if response.status_code == 304 and self._cached is not None:
+            return self._cached
+        response.raise_for_status()
+
+        return self._update_cache(response)
+
+    async def fetch_terms_async(self) -> QueryTermList:
+        """
+        Fetches the list of query terms from the API asynchronously.
+
+        Uses the shared `httpx.AsyncClient` so concurrent fetches reuse the
+        same keep-alive connection pool.
+
+        Returns:
+            A `QueryTermList` object containing the validated query terms.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
             ValidationError: If the API response is not a valid list of terms.
             ValueError: If the API response is not in the expected format.
         """
         url = f"{self.base_url}?key={self.api_key}"
-        response = requests.get(url, timeout=self.timeout)
+        response = await get_async_client(self.timeout).get(
+            url, headers=self._conditional_headers()
+        )
+        if response.status_code == 304 and self._cached is not None:
+            return self._cached
         response.raise_for_status()
-        data = response.json()
 
-        if not isinstance(data, list):
-            raise ValueError("API response is not a list as expected.")
+        return self._update_cache(response)
+
+    def _conditional_headers(self) -> Dict[str, str]:
+        """
+        Build the conditional-GET headers for the last cached response.
+
+        Returns:
+            A headers dictionary with `If-None-Match`/`If-Modified-Since` set
+            when a cached term list and validators are available.
+        """
+        headers: Dict[str, str] = {}
+        if self._cached is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _update_cache(self, response: httpx.Response) -> QueryTermList:
+        """
+        Parse a full response and remember it for future conditional GETs.
+
+        Args:
+            response: The successful (non-304) API response.
+
+        Returns:
+            The parsed `QueryTermList`.
+        """
+        terms = self._parse_body(response.content)
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._cached = terms
+        return terms
+
+    @staticmethod
+    def _parse_body(body: bytes) -> QueryTermList:
+        """
+        Builds a `QueryTermList` from the raw API response bytes.
+
+        The endpoint is trusted, so the body is decoded straight into msgspec
+        structs (skipping per-field pydantic validation); any payload the
+        struct decoder rejects falls back to full `model_validate` and its
+        error reporting.
+
+        Args:
+            body: The raw JSON response body returned by the API.
+
+        Returns:
+            A `QueryTermList` object containing the query terms.
+
+        Raises:
+            ValidationError: If the payload does not match the term schema.
+            ValueError: If the API response is not in the expected format.
+        """
+        try:
+            return decode_terms(body)
+        except msgspec.DecodeError:
+            data = orjson.loads(body)
+            if not isinstance(data, list):
+                raise ValueError("API response is not a list as expected.")
 
-        return QueryTermList.model_validate({"terms": data})
+            return QueryTermList.from_json_list(data)
@@ -1,7 +1,11 @@
-import requests
+import httpx
+import msgspec
+import orjson
 
+from clients.http import DEFAULT_LIMITS, get_async_client
 from config.settings import settings
 from models.alerts import AlertList
+from models.schemas_fast import decode_alerts
 
 
 class AlertTextClient:
@@ -9,7 +13,8 @@ class AlertTextClient:
     Client to fetch alert objects from the Prewave API.
 
     This client handles communication with the alert text API, including
-    authentication and data validation.
+    authentication and data validation. A keep-alive connection pool is
+    shared across calls so repeated fetches reuse the same socket.
     """
 
     def __init__(self, timeout: int = 10):
@@ -27,6 +32,11 @@ class AlertTextClient:
         self.base_url = settings.alert_text_api_url
         self.api_key = settings.alert_api_key
         self.timeout = timeout
+        self._client = httpx.Client(timeout=timeout, limits=DEFAULT_LIMITS)
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its keep-alive connections."""
+        self._client.close()
 
     def fetch_alerts(self) -> AlertList:
         """
@@ -36,16 +46,62 @@ class AlertTextClient:
             An `AlertList` object containing the validated alerts.
 
         Raises:
-            requests.RequestException: If the API request fails.
+            httpx.HTTPError: If the API request fails.
+            ValidationError: If the API response is not a valid list of alerts.
+            ValueError: If the API response is not in the expected format.
+        """
+        url = f"{self.base_url}?key={self.api_key}"
+        response = self._client.get(url)
+        response.raise_for_status()
+
+        return self._parse_body(response.content)
+
+    async def fetch_alerts_async(self) -> AlertList:
+        """
+        Fetches the list of alerts from the API asynchronously.
+
+        Uses the shared `httpx.AsyncClient` so concurrent fetches reuse the
+        same keep-alive connection pool.
+
+        Returns:
+            An `AlertList` object containing the validated alerts.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
             ValidationError: If the API response is not a valid list of alerts.
             ValueError: If the API response is not in the expected format.
         """
         url = f"{self.base_url}?key={self.api_key}"
-        response = requests.get(url, timeout=self.timeout)
+        response = await get_async_client(self.timeout).get(url)
         response.raise_for_status()
-        data = response.json()
 
-        if not isinstance(data, list):
-            raise ValueError("API response is not a list as expected.")
+        return self._parse_body(response.content)
+
+    @staticmethod
+    def _parse_body(body: bytes) -> AlertList:
+        """
+        Builds an `AlertList` from the raw API response bytes.
+
+        The endpoint is trusted, so the body is decoded straight into msgspec
+        structs (skipping per-field pydantic validation); any payload the
+        struct decoder rejects falls back to full `model_validate` and its
+        error reporting.
+
+        Args:
+            body: The raw JSON response body returned by the API.
+
+        Returns:
+            An `AlertList` object containing the alerts.
+
+        Raises:
+            ValidationError: If the payload does not match the alert schema.
+            ValueError: If the API response is not in the expected format.
+        """
+        try:
+            return decode_alerts(body)
+        except msgspec.DecodeError:
+            data = orjson.loads(body)
+            if not isinstance(data, list):
+                raise ValueError("API response is not a list as expected.")
 
-        return AlertList.model_validate({"alerts": data})
+            return AlertList.from_json_list(data)
@@ -0,0 +1,68 @@
+"""Shared HTTP transport helpers for the API clients."""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+# Keep a small pool of keep-alive connections so repeated checks reuse an
+# established TCP/TLS socket instead of paying a handshake per request.
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=4)
+
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_client(timeout: int = 10) -> httpx.AsyncClient:
+    """
+    Return the shared `httpx.AsyncClient`, creating it on first use.
+
+    The client is bound to the running event loop; if called from a different
+    loop (e.g. a fresh `asyncio.run`), a new client is created so pooled
+    connections are never reused across loops.
+
+    Args:
+        timeout: The timeout in seconds applied when the client is created.
+
+    Returns:
+        The shared `httpx.AsyncClient` for the running event loop.
+    """
+    global _async_client, _async_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        if _async_client is not None:
+            # A client left over from another loop (e.g. a run that never
+            # reached `aclose_async_client`) cannot be awaited on its dead
+            # loop; close it best-effort from the current one so its pooled
+            # sockets are released rather than leaked.
+            loop.create_task(_close_quietly(_async_client))
+        _async_client = httpx.AsyncClient(timeout=timeout, limits=DEFAULT_LIMITS)
+        _async_client_loop = loop
+
+    return _async_client
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    """Close a stale client, swallowing errors from resources of a dead loop."""
+    try:
+        await client.aclose()
+    except Exception:
+        pass
+
+
+async def aclose_async_client() -> None:
+    """
+    Close the shared `httpx.AsyncClient`, releasing its pooled connections.
+
+    Must be awaited on the loop the client was created on; the extraction
+    loop calls this before its `asyncio.run` returns, so no client (or its
+    keep-alive sockets) outlives the event loop it is bound to.
+    """
+    global _async_client, _async_client_loop
+
+    if _async_client is not None:
+        client = _async_client
+        _async_client = None
+        _async_client_loop = None
+        await client.aclose()
@@ -0,0 +1,76 @@
+"""Dedicated writer process for the extracted-alerts JSONL log."""
+
+from datetime import datetime
+from queue import Empty
+from typing import TYPE_CHECKING, List, Optional
+
+from config.logger import EXTRACTED_ALERTS_LOG_FILE, logger
+
+if TYPE_CHECKING:
+    import multiprocessing
+
+# Buffered binary appends keep the syscall count bounded at high record rates
+_JSONL_BUFFER_SIZE = 1 << 20  # 1 MiB
+_JSONL_MAX_BYTES = 10 * 1024 * 1024  # rotate at 10 MB, like the general log
+
+
+def log_writer_process(queue: "multiprocessing.Queue") -> None:
+    """
+    Drain pre-serialized JSONL records from a queue and append them to disk.
+
+    Running the writer as its own process keeps all formatting and file I/O
+    off the extraction worker, whose only logging cost becomes a `queue.put`
+    of ready-made bytes. Records queued while a write is in flight are
+    coalesced into a single batched write. A `None` sentinel stops the writer
+    after flushing.
+
+    Args:
+        queue: A `multiprocessing.Queue` of newline-terminated JSON records
+               as bytes, with `None` as the shutdown sentinel.
+    """
+    logger.info("Extracted-alerts log writer started")
+
+    fh = open(EXTRACTED_ALERTS_LOG_FILE, "ab", buffering=_JSONL_BUFFER_SIZE)
+    try:
+        running = True
+        while running:
+            record: Optional[bytes] = queue.get()
+            if record is None:
+                break
+
+            batch: List[bytes] = [record]
+            while True:
+                try:
+                    extra = queue.get_nowait()
+                except Empty:
+                    break
+                if extra is None:
+                    running = False
+                    break
+                batch.append(extra)
+
+            if fh.tell() > _JSONL_MAX_BYTES:
+                fh = _rotate_jsonl_file(fh)
+            fh.write(b"".join(batch))
+            fh.flush()
+    finally:
+        fh.close()
+        logger.info("Extracted-alerts log writer stopped")
+
+
+def _rotate_jsonl_file(fh) -> "object":
+    """
+    Rotate the extracted-alerts file once it exceeds the size limit.
+
+    Args:
+        fh: The currently open binary file handle.
+
+    Returns:
+        A fresh binary handle on the (now empty) log file.
+    """
+    fh.close()
+    rotated_name = EXTRACTED_ALERTS_LOG_FILE.with_name(
+        f"extracted_alerts.{datetime.now():%Y-%m-%d_%H-%M-%S}.jsonl"
+    )
+    EXTRACTED_ALERTS_LOG_FILE.rename(rotated_name)
+    return open(EXTRACTED_ALERTS_LOG_FILE, "ab", buffering=_JSONL_BUFFER_SIZE)
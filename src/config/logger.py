@@ -42,15 +42,7 @@ logger.add(
     filter=lambda record: "extracted_alert" not in record["extra"],
 )
 
-# Configure a separate logger for extracted alerts (JSONL format)
-logger.add(
-    EXTRACTED_ALERTS_LOG_FILE,
-    level="INFO",
-    encoding="utf-8",
-    enqueue=True,
-    backtrace=False,
-    diagnose=False,
-    format="{message}",
-    filter=lambda record: "extracted_alert" in record["extra"],
-    serialize=False,  # We are logging pre-formatted JSON
-)
+# Extracted alerts (JSONL format) are not written through loguru: the worker
+# puts pre-serialized record bytes on a queue drained by the dedicated writer
+# process in `config.log_writer`, keeping all file I/O and formatting off the
+# extraction hot path. Loguru only handles console and general file logs.
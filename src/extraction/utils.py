@@ -1,12 +1,31 @@
+import asyncio
+import os
 import re
-from typing import Set
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+
+import ahocorasick
 
 from clients.AlertTermsClient import AlertTermsClient
 from clients.AlertTextClient import AlertTextClient
 from config.settings import settings
-from models.alerts import Alert
+from models.alerts import Alert, AlertList
 from models.extraction import LogEntry, TermMatch
-from models.query_terms import QueryTerm
+from models.query_terms import QueryTerm, QueryTermList
+
+# Snapshot of `settings.filter_by_language`, bound once at import time.
+# Pydantic settings attribute access is non-trivial at per-(alert, term)
+# frequency; the scan paths read this constant instead.
+_FILTER_BY_LANG: bool = settings.filter_by_language
+
+
+def refresh_settings_bindings() -> None:
+    """Rebind module-level settings snapshots after a runtime reconfiguration."""
+    global _FILTER_BY_LANG
+
+    _FILTER_BY_LANG = settings.filter_by_language
 
 
 def find_term_matches(
@@ -27,24 +46,343 @@ def find_term_matches(
         A `LogEntry` containing the fetched data and all unique matches found.
 
     Raises:
-        requests.RequestException: If an API call fails.
+        httpx.HTTPError: If an API call fails.
         pydantic.ValidationError: If API responses do not match the expected schema.
     """
     alerts = alert_client.fetch_alerts()
     terms = terms_client.fetch_terms()
 
-    matches: Set[TermMatch] = set()
+    return _build_log_entry(alerts, terms)
+
+
+async def find_term_matches_async(
+    alert_client: AlertTextClient,
+    terms_client: AlertTermsClient,
+) -> LogEntry:
+    """
+    Find matches between query terms and alert content, fetching concurrently.
+
+    The alerts and terms endpoints are independent, so both requests are
+    issued at once with `asyncio.gather`, halving the network wait per check.
+
+    Args:
+        alert_client: An instance of `AlertTextClient` to fetch alerts.
+        terms_client: An instance of `AlertTermsClient` to fetch terms.
+
+    Returns:
+        A `LogEntry` containing the fetched data and all unique matches found.
+
+    Raises:
+        httpx.HTTPError: If an API call fails.
+        pydantic.ValidationError: If API responses do not match the expected schema.
+    """
+    alerts, terms = await asyncio.gather(
+        alert_client.fetch_alerts_async(),
+        terms_client.fetch_terms_async(),
+    )
+
+    return _build_log_entry(alerts, terms)
+
+
+def _build_log_entry(alerts: AlertList, terms: QueryTermList) -> LogEntry:
+    """
+    Match the fetched terms against the fetched alerts and build a `LogEntry`.
+
+    Args:
+        alerts: The fetched `AlertList` to search within.
+        terms: The fetched `QueryTermList` to search for.
+
+    Returns:
+        A `LogEntry` containing the fetched data and all unique matches found.
+    """
+    index = _get_term_index(terms)
 
-    for alert in alerts.alerts:
-        for term in terms.terms:
-            if _is_term_in_alert(term, alert):
-                matches.add(TermMatch(alert_id=alert.id, term_id=term.id))
+    # Dedup and sort raw (alert_id, term_id) tuples: tuple hashing and
+    # comparison are C-implemented, unlike the models' custom __hash__/key
+    # lambda. TermMatch objects are only built once per unique match.
+    raw: Set[Tuple[str, int]] = set()
+    if len(alerts.alerts) >= _PARALLEL_SCAN_MIN_ALERTS:
+        # The automaton scan releases the GIL inside pyahocorasick, so
+        # spreading alerts over threads gives real parallelism for large
+        # batches. The index is read-only, so no locking is needed.
+        for alert_id, term_ids in _get_scan_pool().map(
+            lambda alert: (alert.id, _matching_term_ids(alert, index)),
+            alerts.alerts,
+        ):
+            for term_id in term_ids:
+                raw.add((alert_id, term_id))
+    else:
+        for alert in alerts.alerts:
+            for term_id in _matching_term_ids(alert, index):
+                raw.add((alert.id, term_id))
 
     return LogEntry(
         alert_text_data=alerts,
         alert_query_term_data=terms,
-        matches=sorted(list(matches), key=lambda m: (m.alert_id, m.term_id)),
+        matches=[
+            TermMatch(alert_id=alert_id, term_id=term_id)
+            for alert_id, term_id in sorted(raw)
+        ],
+    )
+
+
+@dataclass(frozen=True)
+class _TermIndex:
+    """
+    Precomputed matching structures for a fetched term list.
+
+    Attributes:
+        automaton: An Aho-Corasick automaton over the words of all
+            `keepOrder=False` terms and the full phrases of all
+            `keepOrder=True` terms, or None if the term list is empty. Each
+            key maps to its length, the wordness of its edge characters (for
+            replicating `\\b` boundary semantics), and per-language/overall
+            frozensets of word term IDs (which need a whole-word boundary
+            check) and phrase term IDs (plain substrings, recorded as-is), so
+            every text is scanned exactly once and hits are recorded with
+            C-level set unions.
+    """
+
+    automaton: Optional["ahocorasick.Automaton"]
+
+
+# Scanning alerts is embarrassingly parallel; batches at least this large are
+# dispatched across a shared thread pool, created lazily in the worker.
+_PARALLEL_SCAN_MIN_ALERTS = 32
+_scan_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    """Return the shared alert-scanning thread pool, creating it on first use."""
+    global _scan_pool
+
+    if _scan_pool is None:
+        _scan_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+    return _scan_pool
+
+
+_EMPTY_IDS: frozenset = frozenset()
+
+# Single-slot cache of the last built index, keyed by the term list content so
+# the automaton is only rebuilt when the fetched terms actually change.
+_term_index_cache: Optional[Tuple[int, _TermIndex]] = None
+
+
+def _get_term_index(terms: QueryTermList) -> _TermIndex:
+    """
+    Return the `_TermIndex` for a term list, rebuilding only when it changed.
+
+    Args:
+        terms: The fetched `QueryTermList` to index.
+
+    Returns:
+        A `_TermIndex` with the automaton and phrase lookup structures.
+    """
+    global _term_index_cache
+
+    cache_key = hash(
+        tuple((t.id, t.text, t.language, t.keepOrder) for t in terms.terms)
     )
+    if _term_index_cache is not None and _term_index_cache[0] == cache_key:
+        return _term_index_cache[1]
+
+    word_entries: Dict[str, Dict[str, Set[int]]] = {}
+    phrase_entries: Dict[str, Dict[str, Set[int]]] = {}
+
+    for term in terms.terms:
+        if term.keepOrder:
+            phrase = term.text_lower
+            if phrase:
+                phrase_entries.setdefault(phrase, {}).setdefault(
+                    term.language, set()
+                ).add(term.id)
+        else:
+            for word in term.text_tokens:
+                word_entries.setdefault(word, {}).setdefault(term.language, set()).add(
+                    term.id
+                )
+
+    automaton = None
+    keys = word_entries.keys() | phrase_entries.keys()
+    if keys:
+        automaton = ahocorasick.Automaton()
+        for key in keys:
+            words = word_entries.get(key, {})
+            phrases = phrase_entries.get(key, {})
+            automaton.add_word(
+                key,
+                (
+                    len(key),
+                    _is_word_char(key[0]),
+                    _is_word_char(key[-1]),
+                    {lang: frozenset(ids) for lang, ids in words.items()},
+                    frozenset().union(*words.values()) if words else _EMPTY_IDS,
+                    {lang: frozenset(ids) for lang, ids in phrases.items()},
+                    frozenset().union(*phrases.values()) if phrases else _EMPTY_IDS,
+                ),
+            )
+        automaton.make_automaton()
+
+    index = _TermIndex(automaton=automaton)
+    _term_index_cache = (cache_key, index)
+    return index
+
+
+@lru_cache(maxsize=4096)
+def _term_text_lower(term_text: str) -> str:
+    """
+    Return the lowercased form of a term text, memoized across calls.
+
+    Term sets are mostly stable between checks, so after the first check the
+    lowering is free for every term that was seen before.
+
+    Args:
+        term_text: The raw term text.
+
+    Returns:
+        The lowercased term text.
+    """
+    return term_text.lower()
+
+
+@lru_cache(maxsize=4096)
+def _term_word_pattern(
+    term_text: str,
+) -> Optional[Tuple["re.Pattern[str]", Tuple[str, ...]]]:
+    """
+    Return a compiled whole-word alternation and the words of a term.
+
+    Memoized so each term's words are escaped and its regex compiled once,
+    instead of once per (alert, word) pair on every check.
+
+    Args:
+        term_text: The raw term text (words are space-separated).
+
+    Returns:
+        A tuple of (compiled pattern matching any of the term's lowercased
+        words as a whole word, the lowercased words), or None if the term has
+        no words.
+    """
+    words = tuple(_term_text_lower(term_text).split())
+    if not words:
+        return None
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + r")\b"), words
+
+
+def _is_word_char(char: str) -> bool:
+    """Return whether a character counts as a word character (like regex `\\w`)."""
+    return char.isalnum() or char == "_"
+
+
+# Maximal runs of word characters: splitting a text with this yields exactly
+# the tokens a `\b`-anchored word regex could match.
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=4096)
+def _term_word_tokens(term_text: str) -> Optional[frozenset]:
+    """
+    Return a term's words as a frozenset, if all of them are plain tokens.
+
+    Args:
+        term_text: The raw term text (words are space-separated).
+
+    Returns:
+        The lowercased words as a frozenset when every word consists solely
+        of word characters (so whole-word matching equals token-set
+        membership), or None if any word needs the boundary regex.
+    """
+    words = _term_text_lower(term_text).split()
+    if not words or any(_TOKEN_RE.fullmatch(word) is None for word in words):
+        return None
+    return frozenset(words)
+
+
+@lru_cache(maxsize=1024)
+def _text_token_set(text: str) -> frozenset:
+    """
+    Return the set of word tokens in a text, memoized per text string.
+
+    The combined alert texts are cached per alert, so repeated term checks
+    against the same alert tokenize it only once.
+
+    Args:
+        text: The lowercased text to tokenize.
+
+    Returns:
+        A frozenset of the text's word tokens.
+    """
+    return frozenset(_TOKEN_RE.findall(text))
+
+
+def _matching_term_ids(alert: Alert, index: _TermIndex) -> Set[int]:
+    """
+    Return the IDs of all terms matching an alert using the precomputed index.
+
+    The alert contents are grouped and lowercased once per language, then each
+    text is scanned in a single automaton pass instead of one regex search per
+    (term, word) pair. Matching semantics are unchanged: `keepOrder=True`
+    terms match as an exact phrase, other terms match if at least one of
+    their words appears as a whole word.
+
+    Args:
+        alert: The `Alert` to search within.
+        index: The `_TermIndex` built from the fetched terms.
+
+    Returns:
+        A set of matching term IDs.
+    """
+    matched: Set[int] = set()
+
+    indexed = alert.indexed
+    if _FILTER_BY_LANG:
+        buckets = list(indexed.text_by_language.items())
+    else:
+        buckets = [(None, indexed.combined_lower)] if alert.contents else []
+
+    if index.automaton is None:
+        return matched
+
+    # Bind globals and methods to locals: the loop body runs once per
+    # automaton hit, where LOAD_FAST beats repeated global/attribute lookups
+    automaton_iter = index.automaton.iter
+    is_word_char = _is_word_char
+    empty_ids = _EMPTY_IDS
+
+    for lang, text in buckets:
+        text_len = len(text)
+        for end, entry in automaton_iter(text):
+            (
+                length,
+                first_is_word,
+                last_is_word,
+                word_by_lang,
+                word_ids,
+                phrase_by_lang,
+                phrase_ids,
+            ) = entry
+
+            # Phrases match as plain substrings, so every hit counts
+            if phrase_ids:
+                matched |= (
+                    phrase_ids if lang is None else phrase_by_lang.get(lang, empty_ids)
+                )
+
+            # Words only count at `\b` boundaries: wordness must flip across
+            # each edge of the hit, with text edges counting as non-word.
+            # Comparing against the key's own edge wordness reproduces the
+            # regex semantics for words like "c++" whose edges are non-word.
+            if word_ids:
+                start = end - length + 1
+                if (start > 0 and is_word_char(text[start - 1])) == first_is_word:
+                    continue
+                if (end + 1 < text_len and is_word_char(text[end + 1])) == last_is_word:
+                    continue
+                matched |= (
+                    word_ids if lang is None else word_by_lang.get(lang, empty_ids)
+                )
+
+    return matched
 
 
 def _is_term_in_alert(term: QueryTerm, alert: Alert) -> bool:
@@ -52,7 +390,9 @@ def _is_term_in_alert(term: QueryTerm, alert: Alert) -> bool:
     Check if a query term is present in the content of an alert.
 
     This function handles different matching strategies based on the term's
-    properties, such as language filtering and word order.
+    properties, such as language filtering and word order. The scan itself is
+    delegated to the memoized `_match` kernel, so a `(term, text)` pair that
+    recurs across checks is answered from cache.
 
     Args:
         term: The `QueryTerm` to search for.
@@ -61,23 +401,56 @@ def _is_term_in_alert(term: QueryTerm, alert: Alert) -> bool:
     Returns:
         `True` if the term is found in the alert, `False` otherwise.
     """
-    alert_texts = [
-        content.text
-        for content in alert.contents
-        if (content.language == term.language) or (not settings.filter_by_language)
-    ]
-    if not alert_texts:
+    indexed = alert.indexed
+    if _FILTER_BY_LANG:
+        if term.language not in indexed.language_set:
+            return False
+        combined_text = indexed.text_by_language[term.language]
+    else:
+        combined_text = indexed.combined_lower if alert.contents else ""
+    if not combined_text:
         return False
 
-    combined_text = " ".join(alert_texts).lower()
-    term_text = term.text.lower()
+    return _match(term.text, term.keepOrder, combined_text)
+
+
+@lru_cache(maxsize=65536)
+def _match(term_text: str, keep_order: bool, combined_text: str) -> bool:
+    """
+    Pure matching kernel: does a term occur in a lowercased combined text?
 
-    if term.keepOrder:
+    Keyed on the term text and the text it is searched in, the cache stays
+    correct across fetches without explicit invalidation — fresh payloads
+    with identical content simply hit the same entries, which is the common
+    steady state of the extraction loop.
+
+    Args:
+        term_text: The raw term text (words are space-separated).
+        keep_order: Whether the term matches as an exact phrase.
+        combined_text: The lowercased text to search within.
+
+    Returns:
+        `True` if the term matches the text, `False` otherwise.
+    """
+    if keep_order:
         # Exact phrase match (case-insensitive)
-        return term_text in combined_text
-    else:
-        # At least one word must be present, but order does not matter.
-        return any(
-            re.search(r"\b" + re.escape(word) + r"\b", combined_text)
-            for word in term_text.split()
-        )
+        return _term_text_lower(term_text) in combined_text
+
+    # At least one word must be present, but order does not matter. Terms
+    # made of plain tokens reduce to a C-level set intersection against the
+    # tokenized text.
+    tokens = _term_word_tokens(term_text)
+    if tokens is not None:
+        return not _text_token_set(combined_text).isdisjoint(tokens)
+
+    entry = _term_word_pattern(term_text)
+    if entry is None:
+        return False
+    pattern, words = entry
+
+    # C-level substring pre-filter: if no word occurs even as a raw
+    # substring, the boundary regex cannot match and is never run.
+    if all(combined_text.find(word) == -1 for word in words):
+        return False
+
+    return pattern.search(combined_text) is not None
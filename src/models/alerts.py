@@ -1,9 +1,14 @@
 """Pydantic models for representing alerts and their contents."""
 
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List
+from functools import cached_property
+from typing import Dict, List, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+
+from models._field import F
 
 
 class AlertContent(BaseModel):
@@ -16,14 +21,49 @@ class AlertContent(BaseModel):
         language: The language of the text (e.g., 'en', 'de').
     """
 
-    text: str = Field(..., description="The main text of the content.")
-    type: str = Field(
+    text: str = F(..., description="The main text of the content.")
+    type: str = F(
         ..., description="The type of content (e.g., 'title', 'snippet')."
     )
-    language: str = Field(
+    language: str = F(
         ..., description="The language of the text (e.g., 'en', 'de')."
     )
 
+    @field_validator("language", mode="after")
+    @classmethod
+    def intern_language(cls, v: str) -> str:
+        """Share one str object per language code so equality checks can take
+        the pointer-comparison fast path in the matching loop."""
+        return sys.intern(v)
+
+    @cached_property
+    def text_lower(self) -> str:
+        """The lowercased content text, computed once per instance."""
+        return self.text.lower()
+
+
+@dataclass(frozen=True, slots=True)
+class AlertIndex:
+    """
+    Struct-of-arrays view of an alert's contents for the matching hot loop.
+
+    Reading parallel tuples avoids one pydantic attribute lookup per field
+    per content piece, and the combined texts are lowercased exactly once.
+
+    Attributes:
+        languages: The language of each content piece, in order.
+        texts_lower: The lowercased text of each content piece, in order.
+        language_set: The distinct languages across all contents.
+        text_by_language: Combined lowercased text per language.
+        combined_lower: Combined lowercased text of all contents.
+    """
+
+    languages: Tuple[str, ...]
+    texts_lower: Tuple[str, ...]
+    language_set: frozenset
+    text_by_language: Dict[str, str]
+    combined_lower: str
+
 
 class Alert(BaseModel):
     """
@@ -36,12 +76,12 @@ class Alert(BaseModel):
         inputType: The source or type of the alert input.
     """
 
-    id: str = Field(..., description="The unique identifier for the alert.")
-    contents: List[AlertContent] = Field(
+    id: str = F(..., description="The unique identifier for the alert.")
+    contents: List[AlertContent] = F(
         ..., description="A list of content pieces for the alert."
     )
-    date: datetime = Field(..., description="The timestamp when the alert was issued.")
-    inputType: str = Field(..., description="The source or type of the alert input.")
+    date: datetime = F(..., description="The timestamp when the alert was issued.")
+    inputType: str = F(..., description="The source or type of the alert input.")
 
     @field_validator("date", mode="before")
     @classmethod
@@ -51,18 +91,72 @@ class Alert(BaseModel):
             return v.replace(tzinfo=timezone.utc)
         return v
 
+    @cached_property
+    def indexed(self) -> AlertIndex:
+        """
+        Return the `AlertIndex` view of this alert, built once per instance.
+
+        Returns:
+            An `AlertIndex` with the contents' languages and lowercased texts
+            laid out for the matching hot loop.
+        """
+        languages = tuple(content.language for content in self.contents)
+        texts_lower = tuple(content.text_lower for content in self.contents)
+
+        by_lang: Dict[str, List[str]] = {}
+        for lang, text in zip(languages, texts_lower):
+            by_lang.setdefault(lang, []).append(text)
+
+        return AlertIndex(
+            languages=languages,
+            texts_lower=texts_lower,
+            language_set=frozenset(languages),
+            text_by_language={
+                lang: " ".join(texts) for lang, texts in by_lang.items()
+            },
+            combined_lower=" ".join(texts_lower),
+        )
+
 
 class AlertList(BaseModel):
     """
     Represents a list of alerts, with a timestamp for when the list was created.
 
     Attributes:
-        alerts: A list of `Alert` objects.
+        alerts: A tuple of `Alert` objects.
         created_at: The UTC timestamp of when the list was created.
     """
 
-    alerts: List[Alert] = Field(..., description="A list of alert objects.")
-    created_at: datetime = Field(
+    # A fetched batch is read-only: the tuple field drops list overallocation
+    # and, with frozen, makes the whole payload immutable post-construction.
+    model_config = ConfigDict(frozen=True)
+
+    alerts: Tuple[Alert, ...] = F(..., description="A tuple of alert objects.")
+    created_at: datetime = F(
         default_factory=lambda: datetime.now(timezone.utc),
         description="The UTC timestamp indicating when the list was created.",
     )
+
+    @classmethod
+    def from_json_list(cls, raw_list: List[dict]) -> "AlertList":
+        """
+        Validate a raw list of alert dicts in one batched pydantic-core call.
+
+        Args:
+            raw_list: The decoded JSON list of alert objects.
+
+        Returns:
+            An `AlertList` wrapping the validated alerts.
+
+        Raises:
+            ValidationError: If any element does not match the alert schema.
+        """
+        return cls.model_construct(
+            alerts=tuple(AlertListAdapter.validate_python(raw_list))
+        )
+
+
+# Built once at import: TypeAdapter construction compiles a core schema and is
+# far more expensive than reuse, while validate_python on the whole list keeps
+# the per-element loop inside pydantic-core.
+AlertListAdapter = TypeAdapter(List[Alert])
@@ -4,6 +4,11 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+# These models are rendered into the served OpenAPI schema at /docs, so they
+# keep pydantic's `Field` unconditionally; the description-stripping `F`
+# wrapper is reserved for the worker-side model modules that never surface
+# in the API documentation.
+
 
 class ExtractionRequest(BaseModel):
     """
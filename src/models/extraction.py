@@ -1,63 +1,69 @@
 """Pydantic models for representing term matching results."""
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from models._field import F
 
 from models.alerts import AlertList
 from models.query_terms import QueryTermList
 
 
-class TermMatch(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TermMatch:
     """
     Represents a unique match between an alert and a query term.
 
-    This model is hashable to allow for efficient storage in sets,
-    preventing duplicate matches.
+    A frozen dataclass rather than a pydantic model: matches are built in the
+    scan's tight loop from already-validated IDs, so construction skips
+    validation entirely, and the generated structural `__eq__`/`__hash__`
+    make instances safe to dedup in sets.
 
     Attributes:
         alert_id: The ID of the alert where the match was found.
         term_id: The ID of the term that was matched.
     """
 
-    alert_id: str = Field(..., description="The ID of the matched alert.")
-    term_id: int = Field(..., description="The ID of the matched query term.")
-
-    def __hash__(self) -> int:
-        """
-        Provide a hash based on the composite key of alert_id and term_id.
-        """
-        return hash((self.alert_id, self.term_id))
-
-    def __eq__(self, other: object) -> bool:
-        """
-        Define equality based on the alert_id and term_id.
-        """
-        if not isinstance(other, TermMatch):
-            return NotImplemented
-        return self.alert_id == other.alert_id and self.term_id == other.term_id
+    alert_id: str
+    term_id: int
 
 
 class LogEntry(BaseModel):
     """
     Represents a single log entry for the extraction process.
 
+    The full payloads may be omitted in favour of their content hashes when a
+    log sink has already recorded them, since consecutive checks usually fetch
+    identical data.
+
     Attributes:
         created_at: The UTC timestamp indicating when the list was generated.
-        alert_text_data: The alert text data fetched from the API.
-        alert_query_term_data: The query term data fetched from the API.
+        alert_text_data: The alert text data fetched from the API, if embedded.
+        alert_query_term_data: The query term data fetched from the API, if embedded.
+        alert_text_hash: Content hash referencing a previously logged alert payload.
+        alert_query_term_hash: Content hash referencing a previously logged term payload.
         matches: A list of `TermMatch` objects.
     """
 
-    created_at: datetime = Field(
+    created_at: datetime = F(
         default_factory=lambda: datetime.now(timezone.utc),
         description="The UTC timestamp of when the match list was created.",
     )
-    alert_text_data: AlertList = Field(
-        ..., description="The alert text data fetched from the API."
+    alert_text_data: Optional[AlertList] = F(
+        default=None, description="The alert text data fetched from the API."
+    )
+    alert_query_term_data: Optional[QueryTermList] = F(
+        default=None, description="The query term data fetched from the API."
+    )
+    alert_text_hash: Optional[str] = F(
+        default=None,
+        description="Content hash referencing a previously logged alert payload.",
     )
-    alert_query_term_data: QueryTermList = Field(
-        ..., description="The query term data fetched from the API."
+    alert_query_term_hash: Optional[str] = F(
+        default=None,
+        description="Content hash referencing a previously logged term payload.",
     )
-    matches: List[TermMatch] = Field(..., description="A list of unique term matches.")
+    matches: List[TermMatch] = F(..., description="A list of unique term matches.")
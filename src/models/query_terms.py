@@ -1,9 +1,39 @@
 """Pydantic models for representing query terms used in extraction."""
 
+import sys
 from datetime import datetime, timezone
-from typing import List
+from functools import cached_property
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+
+from models._field import F
+
+# Resolved once at import so the created_at default does not re-look-up
+# `timezone.utc` on every instantiation.
+_UTC = timezone.utc
+
+# When set, `created_at` defaults return this constant instead of calling
+# `datetime.now`, sparing hot paths (and timing tests) the clock syscall.
+_frozen_time: Optional[datetime] = None
+
+
+def set_frozen_time(ts: Optional[datetime]) -> None:
+    """
+    Freeze the timestamp used for `created_at` defaults, or unfreeze with None.
+
+    Args:
+        ts: The timestamp to return from every subsequent default, or None to
+            fall back to the real clock.
+    """
+    global _frozen_time
+
+    _frozen_time = ts
+
+
+def _now() -> datetime:
+    """Return the frozen timestamp if one is set, else the current UTC time."""
+    return _frozen_time or datetime.now(_UTC)
 
 
 class QueryTerm(BaseModel):
@@ -19,34 +49,84 @@ class QueryTerm(BaseModel):
             - If `False`, the words can appear in any order in the text.
     """
 
-    id: int = Field(..., description="Unique identifier for the query term.")
-    text: str = Field(
+    # Terms are immutable records: freezing enables pydantic's generated
+    # __hash__, and unknown API fields are dropped instead of stored.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    id: int = F(..., description="Unique identifier for the query term.")
+    text: str = F(
         ..., description="The text to search for (words are space-separated)."
     )
-    language: str = Field(
+    language: str = F(
         ...,
         min_length=2,
         max_length=2,
         description="Two-letter language code for the term (e.g., 'en').",
     )
-    keepOrder: bool = Field(
+    keepOrder: bool = F(
         ...,
-        alias="keepOrder",
         description="If true, match text as an exact phrase; otherwise, match words in any order.",
     )
 
+    @field_validator("language", mode="after")
+    @classmethod
+    def intern_language(cls, v: str) -> str:
+        """Share one str object per language code so equality checks can take
+        the pointer-comparison fast path in the matching loop."""
+        return sys.intern(v)
+
+    @cached_property
+    def text_lower(self) -> str:
+        """The lowercased term text, computed once per instance."""
+        return self.text.lower()
+
+    @cached_property
+    def text_tokens(self) -> Tuple[str, ...]:
+        """The lowercased term words, split once per instance."""
+        return tuple(self.text_lower.split())
+
 
 class QueryTermList(BaseModel):
     """
     Represents a list of query terms, with a timestamp for creation.
 
     Attributes:
-        terms: A list of `QueryTerm` objects.
+        terms: A tuple of `QueryTerm` objects.
         created_at: The UTC timestamp indicating when the list was created.
     """
 
-    terms: List[QueryTerm] = Field(..., description="A list of query term objects.")
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    # A fetched batch is read-only: the tuple field drops list overallocation
+    # and makes the payload immutable all the way down.
+    terms: Tuple[QueryTerm, ...] = F(
+        ..., description="A tuple of query term objects."
+    )
+    created_at: datetime = F(
+        default_factory=_now,
         description="The UTC timestamp of when the term list was created.",
     )
+
+    @classmethod
+    def from_json_list(cls, raw_list: List[dict]) -> "QueryTermList":
+        """
+        Validate a raw list of term dicts in one batched pydantic-core call.
+
+        Args:
+            raw_list: The decoded JSON list of term objects.
+
+        Returns:
+            A `QueryTermList` wrapping the validated terms.
+
+        Raises:
+            ValidationError: If any element does not match the term schema.
+        """
+        return cls.model_construct(
+            terms=tuple(QueryTermListAdapter.validate_python(raw_list))
+        )
+
+
+# Built once at import: TypeAdapter construction compiles a core schema and is
+# far more expensive than reuse, while validate_python on the whole list keeps
+# the per-element loop inside pydantic-core.
+QueryTermListAdapter = TypeAdapter(List[QueryTerm])
@@ -0,0 +1,116 @@
+"""msgspec structs for fast in-worker decoding of API payloads.
+
+These structs mirror the pydantic models' wire format and let the clients
+decode JSON response bytes directly into typed objects at C speed. The public
+API boundary still returns pydantic models; conversion happens here via
+`model_construct` so no field is validated twice.
+"""
+
+import sys
+from datetime import datetime, timezone
+from typing import List
+
+import msgspec
+
+from models.alerts import Alert, AlertContent, AlertList
+from models.query_terms import QueryTerm, QueryTermList
+
+
+class AlertContentStruct(msgspec.Struct):
+    """Wire-format counterpart of `AlertContent`."""
+
+    text: str
+    type: str
+    language: str
+
+
+class AlertStruct(msgspec.Struct):
+    """Wire-format counterpart of `Alert`."""
+
+    id: str
+    contents: List[AlertContentStruct]
+    date: datetime
+    inputType: str
+
+
+class QueryTermStruct(msgspec.Struct):
+    """Wire-format counterpart of `QueryTerm`."""
+
+    id: int
+    text: str
+    language: str
+    keepOrder: bool
+
+
+_alerts_decoder = msgspec.json.Decoder(List[AlertStruct])
+_terms_decoder = msgspec.json.Decoder(List[QueryTermStruct])
+
+
+def decode_alerts(body: bytes) -> AlertList:
+    """
+    Decode an alerts payload straight from JSON bytes into an `AlertList`.
+
+    Args:
+        body: The raw JSON response body.
+
+    Returns:
+        An `AlertList` built from the decoded structs.
+
+    Raises:
+        msgspec.DecodeError: If the body does not match the alerts schema.
+    """
+    structs = _alerts_decoder.decode(body)
+
+    return AlertList.model_construct(
+        alerts=tuple(
+            Alert.model_construct(
+                id=item.id,
+                contents=[
+                    AlertContent.model_construct(
+                        text=content.text,
+                        type=content.type,
+                        # Interned like the validator path, so language
+                        # comparisons stay pointer-fast
+                        language=sys.intern(content.language),
+                    )
+                    for content in item.contents
+                ],
+                # Naive dates are assumed UTC, matching `Alert.ensure_timezone`
+                date=item.date
+                if item.date.tzinfo is not None
+                else item.date.replace(tzinfo=timezone.utc),
+                inputType=item.inputType,
+            )
+            for item in structs
+        )
+    )
+
+
+def decode_terms(body: bytes) -> QueryTermList:
+    """
+    Decode a query terms payload straight from JSON bytes into a `QueryTermList`.
+
+    Args:
+        body: The raw JSON response body.
+
+    Returns:
+        A `QueryTermList` built from the decoded structs.
+
+    Raises:
+        msgspec.DecodeError: If the body does not match the terms schema.
+    """
+    structs = _terms_decoder.decode(body)
+
+    return QueryTermList.model_construct(
+        terms=tuple(
+            QueryTerm.model_construct(
+                id=item.id,
+                text=item.text,
+                # Interned like the validator path, so language comparisons
+                # stay pointer-fast
+                language=sys.intern(item.language),
+                keepOrder=item.keepOrder,
+            )
+            for item in structs
+        )
+    )
@@ -1,18 +1,25 @@
-import time
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
-import requests
+import httpx
+import orjson
+import respx
 from pydantic import ValidationError
 
 from clients.AlertTermsClient import AlertTermsClient
 from models.query_terms import QueryTerm, QueryTermList
 
+# Shared, immutable payload (tuple, so no test can mutate it) and its
+# pre-serialized body, built once at collection instead of per test.
+_TERMS_PAYLOAD = ({"id": 1, "text": "term1", "language": "en", "keepOrder": True},)
+_TERMS_BODY = orjson.dumps(_TERMS_PAYLOAD)
+
 
 @pytest.fixture
 def mock_requests_get():
-    """Fixture to patch requests.get."""
-    with patch("requests.get") as mock_get:
+    """Fixture to patch httpx.Client.get."""
+    with patch("httpx.Client.get") as mock_get:
         yield mock_get
 
 
@@ -23,9 +30,7 @@ def test_fetch_terms_success(mock_requests_get):
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
-        {"id": 1, "text": "term1", "language": "en", "keepOrder": True}
-    ]
+    mock_response.content = _TERMS_BODY
     mock_requests_get.return_value = mock_response
 
     client = AlertTermsClient()
@@ -46,11 +51,11 @@ def test_fetch_terms_http_error(mock_requests_get):
     Test handling of an HTTP error during API call.
     """
     # Arrange
-    mock_requests_get.side_effect = requests.RequestException("API is down")
+    mock_requests_get.side_effect = httpx.RequestError("API is down")
     client = AlertTermsClient()
 
     # Act & Assert
-    with pytest.raises(requests.RequestException):
+    with pytest.raises(httpx.RequestError):
         client.fetch_terms()
 
 
@@ -61,7 +66,7 @@ def test_fetch_terms_validation_error(mock_requests_get):
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [{"id": 1, "text": "term1"}]  # Missing fields
+    mock_response.content = orjson.dumps([{"id": 1, "text": "term1"}])  # Missing fields
     mock_requests_get.return_value = mock_response
 
     client = AlertTermsClient()
@@ -78,7 +83,7 @@ def test_fetch_terms_invalid_response_format(mock_requests_get):
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "not a list"}
+    mock_response.content = orjson.dumps({"data": "not a list"})
     mock_requests_get.return_value = mock_response
 
     client = AlertTermsClient()
@@ -101,32 +106,54 @@ def test_client_initialization_missing_config():
             AlertTermsClient()
 
 
-@pytest.mark.parametrize("calls, delay", [(1, 0), (3, 0.1)])
-def test_fetch_terms_performance(calls, delay, mock_requests_get):
+def test_fetch_terms_conditional_get_returns_cache(mock_requests_get):
+    """
+    Test that a 304 Not Modified response returns the cached term list.
+    """
+    # Arrange
+    full_response = MagicMock()
+    full_response.status_code = 200
+    full_response.content = _TERMS_BODY
+    full_response.headers = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    not_modified_response = MagicMock()
+    not_modified_response.status_code = 304
+
+    mock_requests_get.side_effect = [full_response, not_modified_response]
+
+    client = AlertTermsClient()
+
+    # Act
+    first = client.fetch_terms()
+    second = client.fetch_terms()
+
+    # Assert
+    assert second is first
+    _, second_call_kwargs = mock_requests_get.call_args
+    assert second_call_kwargs["headers"]["If-None-Match"] == '"abc"'
+    assert (
+        second_call_kwargs["headers"]["If-Modified-Since"]
+        == "Mon, 01 Jan 2024 00:00:00 GMT"
+    )
+
+
+def test_fetch_terms_performance(benchmark, calls, mock_requests_get):
     """
-    Test the performance of fetching terms multiple times.
-    This is a simplified version of the original test.
+    Benchmark fetching terms; the number of rounds is driven by --calls.
     """
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
-        {"id": 1, "text": "term1", "language": "en", "keepOrder": True}
-    ]
+    mock_response.content = _TERMS_BODY
     mock_requests_get.return_value = mock_response
 
     client = AlertTermsClient()
-    terms = None
 
     # Act
-    for _ in range(calls):
-        if delay > 0:
-            time.sleep(delay)
-        terms = client.fetch_terms()
+    terms = benchmark.pedantic(client.fetch_terms, rounds=calls)
 
     # Assert
     assert isinstance(terms, QueryTermList)
-    assert terms is not None
     assert len(terms.terms) > 0
 
 
@@ -135,9 +162,32 @@ def test_fetch_terms_request_error(mock_requests_get):
     Test handling of a request error (e.g., connection error) during API call.
     """
     # Arrange
-    mock_requests_get.side_effect = requests.ConnectionError("Failed to connect")
+    mock_requests_get.side_effect = httpx.ConnectError("Failed to connect")
     client = AlertTermsClient()
 
     # Act & Assert
-    with pytest.raises(requests.ConnectionError, match="Failed to connect"):
+    with pytest.raises(httpx.ConnectError, match="Failed to connect"):
         client.fetch_terms()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_terms_async_concurrent(calls):
+    """
+    Test that concurrent async fetches all resolve against a mocked transport.
+    """
+    # Arrange
+    client = AlertTermsClient()
+    route = respx.get(url__startswith=client.base_url).mock(
+        return_value=httpx.Response(200, content=_TERMS_BODY)
+    )
+
+    # Act
+    results = await asyncio.gather(
+        *[client.fetch_terms_async() for _ in range(max(calls, 2))]
+    )
+
+    # Assert
+    assert route.called
+    assert all(isinstance(terms, QueryTermList) for terms in results)
+    assert all(len(terms.terms) > 0 for terms in results)
@@ -1,19 +1,33 @@
-import time
+import asyncio
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-import requests
+import httpx
+import orjson
+import respx
 from pydantic import ValidationError
 
 from clients.AlertTextClient import AlertTextClient
 from models.alerts import Alert, AlertList
 
+# Shared, immutable payload (tuple, so no test can mutate it) and its
+# pre-serialized body, built once at collection instead of per test.
+_ALERTS_PAYLOAD = (
+    {
+        "id": "1",
+        "contents": [{"text": "alert1", "type": "title", "language": "en"}],
+        "date": "2023-01-01T12:00:00Z",
+        "inputType": "test",
+    },
+)
+_ALERTS_BODY = orjson.dumps(_ALERTS_PAYLOAD)
+
 
 @pytest.fixture
 def mock_requests_get():
-    """Fixture to patch requests.get."""
-    with patch("requests.get") as mock_get:
+    """Fixture to patch httpx.Client.get."""
+    with patch("httpx.Client.get") as mock_get:
         yield mock_get
 
 
@@ -24,14 +38,7 @@ def test_fetch_alerts_success(mock_requests_get):
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
-        {
-            "id": "1",
-            "contents": [{"text": "alert1", "type": "title", "language": "en"}],
-            "date": "2023-01-01T12:00:00Z",
-            "inputType": "test",
-        }
-    ]
+    mock_response.content = _ALERTS_BODY
     mock_requests_get.return_value = mock_response
 
     client = AlertTextClient()
@@ -53,11 +60,11 @@ def test_fetch_alerts_http_error(mock_requests_get):
     Test handling of an HTTP error during API call.
     """
     # Arrange
-    mock_requests_get.side_effect = requests.RequestException("API is down")
+    mock_requests_get.side_effect = httpx.RequestError("API is down")
     client = AlertTextClient()
 
     # Act & Assert
-    with pytest.raises(requests.RequestException):
+    with pytest.raises(httpx.RequestError):
         client.fetch_alerts()
 
 
@@ -68,7 +75,7 @@ def test_fetch_alerts_validation_error(mock_requests_get):
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [{"id": "1"}]
+    mock_response.content = orjson.dumps([{"id": "1"}])
     mock_requests_get.return_value = mock_response
 
     client = AlertTextClient()
@@ -83,11 +90,11 @@ def test_fetch_alerts_request_error(mock_requests_get):
     Test handling of request errors (e.g., connection errors).
     """
     # Arrange
-    mock_requests_get.side_effect = requests.ConnectionError("Failed to connect")
+    mock_requests_get.side_effect = httpx.ConnectError("Failed to connect")
     client = AlertTextClient()
 
     # Act & Assert
-    with pytest.raises(requests.ConnectionError, match="Failed to connect"):
+    with pytest.raises(httpx.ConnectError, match="Failed to connect"):
         client.fetch_alerts()
 
 
@@ -98,7 +105,7 @@ def test_fetch_alerts_invalid_response_format(mock_requests_get):
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "not a list"}
+    mock_response.content = orjson.dumps({"data": "not a list"})
     mock_requests_get.return_value = mock_response
 
     client = AlertTextClient()
@@ -121,34 +128,44 @@ def test_client_initialization_missing_config():
             AlertTextClient()
 
 
-@pytest.mark.parametrize("calls, delay", [(1, 0), (3, 0.1)])
-def test_fetch_alerts_performance(calls, delay, mock_requests_get):
+def test_fetch_alerts_performance(benchmark, calls, mock_requests_get):
     """
-    Test the performance of fetching alerts multiple times.
+    Benchmark fetching alerts; the number of rounds is driven by --calls.
     """
     # Arrange
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
-        {
-            "id": "1",
-            "contents": [{"text": "alert1", "type": "title", "language": "en"}],
-            "date": "2023-01-01T12:00:00Z",
-            "inputType": "test",
-        }
-    ]
+    mock_response.content = _ALERTS_BODY
     mock_requests_get.return_value = mock_response
 
     client = AlertTextClient()
-    alerts = None
 
     # Act
-    for _ in range(calls):
-        if delay > 0:
-            time.sleep(delay)
-        alerts = client.fetch_alerts()
+    alerts = benchmark.pedantic(client.fetch_alerts, rounds=calls)
 
     # Assert
     assert isinstance(alerts, AlertList)
-    assert alerts is not None
     assert len(alerts.alerts) > 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_alerts_async_concurrent(calls):
+    """
+    Test that concurrent async fetches all resolve against a mocked transport.
+    """
+    # Arrange
+    client = AlertTextClient()
+    route = respx.get(url__startswith=client.base_url).mock(
+        return_value=httpx.Response(200, content=_ALERTS_BODY)
+    )
+
+    # Act
+    results = await asyncio.gather(
+        *[client.fetch_alerts_async() for _ in range(max(calls, 2))]
+    )
+
+    # Assert
+    assert route.called
+    assert all(isinstance(alerts, AlertList) for alerts in results)
+    assert all(len(alerts.alerts) > 0 for alerts in results)
@@ -1,5 +1,60 @@
+from datetime import datetime, timezone
+
 import pytest
 
+from models.alerts import Alert, AlertContent
+
+
+def build_alert(**kwargs) -> Alert:
+    """
+    Build an `Alert` from trusted keyword arguments without validation.
+
+    Test data is known-good, so the alert and its contents are assembled with
+    `model_construct`, skipping pydantic-core validation on every fixture
+    setup. Contents may be given as dicts or `AlertContent` instances; naive
+    dates are coerced to UTC, mirroring `Alert.ensure_timezone`.
+    """
+    contents = [
+        content
+        if isinstance(content, AlertContent)
+        else AlertContent.model_construct(**content)
+        for content in kwargs.pop("contents", [])
+    ]
+    date = kwargs.pop("date", None) or datetime.now(timezone.utc)
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return Alert.model_construct(contents=contents, date=date, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def make_alert():
+    """Factory fixture so all test modules share one trusted-alert builder."""
+    return build_alert
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_model_schemas():
+    """
+    Compile the pydantic core schemas once, up front.
+
+    Pydantic v2 builds a model's validator lazily on first validation; doing
+    it here keeps that one-off cost out of whichever (possibly
+    timing-sensitive) test happens to run first.
+    """
+    from models.query_terms import QueryTerm
+
+    Alert.model_validate(
+        {
+            "id": "warmup",
+            "contents": [{"text": "", "type": "", "language": "en"}],
+            "date": datetime(2023, 1, 1, tzinfo=timezone.utc),
+            "inputType": "test",
+        }
+    )
+    QueryTerm.model_validate(
+        {"id": 0, "text": "", "language": "en", "keepOrder": False}
+    )
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -7,22 +62,10 @@ def pytest_addoption(parser):
         action="store",
         default=1,
         type=int,
-        help="Number of API calls to make",
-    )
-    parser.addoption(
-        "--delay",
-        action="store",
-        default=0,
-        type=float,
-        help="Delay between API calls in seconds",
+        help="Number of benchmark rounds for the performance tests",
     )
 
 
 @pytest.fixture
 def calls(request):
     return request.config.getoption("--calls")
-
-
-@pytest.fixture
-def delay(request):
-    return request.config.getoption("--delay")
@@ -1,54 +1,60 @@
 """Tests for the extraction utility functions."""
 
 from datetime import datetime
-from unittest.mock import MagicMock
 
 import pytest
 
 from config.settings import settings
-from extraction.utils import _is_term_in_alert, find_term_matches
-from models.alerts import Alert, AlertContent, AlertList
+from extraction.utils import (
+    _is_term_in_alert,
+    find_term_matches,
+    refresh_settings_bindings,
+)
+from models.alerts import Alert, AlertList
 from models.extraction import TermMatch
 from models.query_terms import QueryTerm, QueryTermList
 
 
-# Fixtures for reusable test data
-@pytest.fixture
-def sample_alert() -> Alert:
-    """Returns a sample Alert object for testing."""
-    return Alert(
+# Fixtures for reusable test data. The alert fixtures are read-only for
+# every test, so they are built once per module.
+@pytest.fixture(scope="module")
+def sample_alert(make_alert) -> Alert:
+    """Returns a sample Alert object built without validation."""
+    return make_alert(
         id="alert_123",
         contents=[
-            AlertContent(
-                text="A major supply chain disruption occurred.",
-                type="title",
-                language="en",
-            ),
-            AlertContent(
-                text="The disruption in the supply chain affects all sectors.",
-                type="snippet",
-                language="en",
-            ),
-            AlertContent(
-                text="Eine Störung der Lieferkette.", type="title", language="de"
-            ),
+            {
+                "text": "A major supply chain disruption occurred.",
+                "type": "title",
+                "language": "en",
+            },
+            {
+                "text": "The disruption in the supply chain affects all sectors.",
+                "type": "snippet",
+                "language": "en",
+            },
+            {
+                "text": "Eine Störung der Lieferkette.",
+                "type": "title",
+                "language": "de",
+            },
         ],
         date=datetime(2023, 1, 1),
         inputType="news",
     )
 
 
-@pytest.fixture
-def simple_alert() -> Alert:
+@pytest.fixture(scope="module")
+def simple_alert(make_alert) -> Alert:
     """Returns a simple Alert object with one content piece."""
-    return Alert(
+    return make_alert(
         id="alert_simple",
         contents=[
-            AlertContent(
-                text="The quick brown fox jumps over the lazy dog.",
-                type="text",
-                language="en",
-            )
+            {
+                "text": "The quick brown fox jumps over the lazy dog.",
+                "type": "text",
+                "language": "en",
+            }
         ],
         date=datetime(2023, 1, 1),
         inputType="news",
@@ -79,6 +85,7 @@ def test_is_term_in_alert_various_cases(term_text, keep_order, expected, sample_
     """Test term matching with different term texts and keepOrder flags."""
     term = QueryTerm(id=1, text=term_text, language="en", keepOrder=keep_order)
     settings.filter_by_language = True
+    refresh_settings_bindings()
     assert _is_term_in_alert(term, sample_alert) is expected
 
 
@@ -86,6 +93,7 @@ def test_is_term_in_alert_language_mismatch(sample_alert):
     """Test that a term does not match if its language is not in the alert (with filtering)."""
     term = QueryTerm(id=1, text="supply chain", language="fr", keepOrder=True)
     settings.filter_by_language = True
+    refresh_settings_bindings()
     assert not _is_term_in_alert(term, sample_alert)
 
 
@@ -94,51 +102,106 @@ def test_is_term_in_alert_whole_word_matching(simple_alert):
     term_positive = QueryTerm(id=1, text="fox", language="en", keepOrder=False)
     term_negative = QueryTerm(id=2, text="ox", language="en", keepOrder=False)
     settings.filter_by_language = True
+    refresh_settings_bindings()
     assert _is_term_in_alert(term_positive, simple_alert)
     assert not _is_term_in_alert(term_negative, simple_alert)
 
 
+@pytest.mark.parametrize(
+    "alert_text, expected",
+    [
+        # `\b` after the final "+" needs a word character on its right, so a
+        # space after "c++" is not a boundary and the term must not match.
+        ("i code in c++ daily", False),
+        # A word character right after the "+" is a boundary, so this matches.
+        ("ported to c++x last year", True),
+    ],
+)
+def test_is_term_in_alert_non_word_edge_boundaries(alert_text, expected, make_alert):
+    """Terms with non-word edge characters keep `\\b` transition semantics on both matching paths."""
+    alert = make_alert(
+        id="alert_edge",
+        contents=[{"text": alert_text, "type": "text", "language": "en"}],
+        date=datetime(2023, 1, 1),
+        inputType="news",
+    )
+    term = QueryTerm(id=1, text="c++", language="en", keepOrder=False)
+    settings.filter_by_language = True
+    refresh_settings_bindings()
+
+    assert _is_term_in_alert(term, alert) is expected
+
+    # The automaton-based production path must agree with the regex kernel
+    result = find_term_matches(
+        _StubAlertClient(AlertList.model_construct(alerts=(alert,))),
+        _StubTermsClient(QueryTermList.model_construct(terms=(term,))),
+    )
+    assert (len(result.matches) == 1) is expected
+
+
 # --- Tests for find_term_matches ---
 
 
+# Slotted stubs instead of MagicMock: fetch calls resolve with C-level
+# attribute lookup rather than mock __getattr__ dispatch and call-record
+# bookkeeping, which the matching tests never inspect anyway.
+class _StubAlertClient:
+    """Minimal stand-in for `AlertTextClient` returning a fixed alert list."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: AlertList):
+        self.response = response
+
+    def fetch_alerts(self) -> AlertList:
+        return self.response
+
+
+class _StubTermsClient:
+    """Minimal stand-in for `AlertTermsClient` returning a fixed term list."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: QueryTermList):
+        self.response = response
+
+    def fetch_terms(self) -> QueryTermList:
+        return self.response
+
+
 @pytest.fixture
-def mock_alert_client() -> MagicMock:
-    """Fixture for a mocked AlertTextClient."""
-    client = MagicMock()
-    alerts = [
-        Alert(
+def mock_alert_client(make_alert) -> _StubAlertClient:
+    """Fixture for a stubbed AlertTextClient."""
+    alerts = (
+        make_alert(
             id="a1",
-            contents=[AlertContent(text="term one", language="en", type="")],
-            date=datetime.now(),
+            contents=[{"text": "term one", "language": "en", "type": ""}],
             inputType="test",
         ),
-        Alert(
+        make_alert(
             id="a2",
-            contents=[AlertContent(text="term two", language="en", type="")],
-            date=datetime.now(),
+            contents=[{"text": "term two", "language": "en", "type": ""}],
             inputType="test",
         ),
-    ]
-    client.fetch_alerts.return_value = AlertList(alerts=alerts)
-    return client
+    )
+    return _StubAlertClient(AlertList.model_construct(alerts=alerts))
 
 
 @pytest.fixture
-def mock_terms_client() -> MagicMock:
-    """Fixture for a mocked AlertTermsClient."""
-    client = MagicMock()
-    terms = [
-        QueryTerm(id=1, text="term one", language="en", keepOrder=True),
-        QueryTerm(id=2, text="two term", language="en", keepOrder=False),
-        QueryTerm(id=3, text="no match", language="en", keepOrder=True),
-    ]
-    client.fetch_terms.return_value = QueryTermList(terms=terms)
-    return client
+def mock_terms_client() -> _StubTermsClient:
+    """Fixture for a stubbed AlertTermsClient."""
+    terms = (
+        QueryTerm.model_construct(id=1, text="term one", language="en", keepOrder=True),
+        QueryTerm.model_construct(id=2, text="two term", language="en", keepOrder=False),
+        QueryTerm.model_construct(id=3, text="no match", language="en", keepOrder=True),
+    )
+    return _StubTermsClient(QueryTermList.model_construct(terms=terms))
 
 
 def test_find_term_matches_finds_correct_matches(mock_alert_client, mock_terms_client):
     """Test that find_term_matches correctly identifies and returns unique matches."""
     settings.filter_by_language = True
+    refresh_settings_bindings()
     result = find_term_matches(mock_alert_client, mock_terms_client)
 
     assert len(result.matches) == 3
@@ -147,15 +210,20 @@ def test_find_term_matches_finds_correct_matches(mock_alert_client, mock_terms_c
     assert TermMatch(alert_id="a1", term_id=2) in result.matches
 
 
-def test_find_term_matches_returns_sorted_results(mock_alert_client, mock_terms_client):
+def test_find_term_matches_returns_sorted_results(
+    mock_alert_client, mock_terms_client, make_alert
+):
     """Test that the returned matches are sorted."""
-    # Add another match to test sorting
-    mock_alert_client.fetch_alerts.return_value.alerts.append(
-        Alert(
-            id="a0",
-            contents=[AlertContent(text="term two", language="en", type="")],
-            date=datetime.now(),
-            inputType="test",
+    # Add another match to test sorting: alerts is an immutable tuple now, so
+    # simulate a new fetch by rebuilding the list with the extra alert
+    mock_alert_client.response = AlertList.model_construct(
+        alerts=mock_alert_client.response.alerts
+        + (
+            make_alert(
+                id="a0",
+                contents=[{"text": "term two", "language": "en", "type": ""}],
+                inputType="test",
+            ),
         )
     )
     result = find_term_matches(mock_alert_client, mock_terms_client)
@@ -170,9 +238,14 @@ def test_find_term_matches_returns_sorted_results(mock_alert_client, mock_terms_
 
 def test_find_term_matches_no_matches(mock_alert_client, mock_terms_client):
     """Test that an empty list is returned when no matches are found."""
-    mock_terms_client.fetch_terms.return_value.terms = [
-        QueryTerm(id=3, text="no match", language="en", keepOrder=True)
-    ]
+    # QueryTermList is frozen, so swap in a rebuilt list instead of mutating
+    mock_terms_client.response = QueryTermList.model_construct(
+        terms=(
+            QueryTerm.model_construct(
+                id=3, text="no match", language="en", keepOrder=True
+            ),
+        )
+    )
     result = find_term_matches(mock_alert_client, mock_terms_client)
     assert len(result.matches) == 0
 
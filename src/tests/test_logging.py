@@ -1,52 +1,78 @@
 """Tests for the logging configuration and output."""
 
-import json
+import queue
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
 
+import orjson
 import pytest
 
+import app.utils as app_utils
+import config.log_writer as log_writer
+from app.utils import _serialize_log_records
 from extraction.utils import find_term_matches
-from models.alerts import Alert, AlertContent, AlertList
+from models.alerts import AlertList
 from models.extraction import LogEntry
 from models.query_terms import QueryTerm, QueryTermList
 
 
-@pytest.fixture
-def mock_api_clients():
-    """Fixture to create mock API clients with predefined data."""
-    alert_client = MagicMock()
-    terms_client = MagicMock()
+# Slotted stubs instead of MagicMock: fetch calls resolve with C-level
+# attribute lookup rather than mock __getattr__ dispatch.
+class _StubAlertClient:
+    """Minimal stand-in for `AlertTextClient` returning a fixed alert list."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: AlertList):
+        self.response = response
+
+    def fetch_alerts(self) -> AlertList:
+        return self.response
+
+
+class _StubTermsClient:
+    """Minimal stand-in for `AlertTermsClient` returning a fixed term list."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: QueryTermList):
+        self.response = response
 
-    # Mock data for alerts
-    mock_alerts = AlertList(
-        alerts=[
-            Alert(
+    def fetch_terms(self) -> QueryTermList:
+        return self.response
+
+
+# Module scope: no test mutates the returned stubs or their payloads, so the
+# models and stubs are built once for the whole module.
+@pytest.fixture(scope="module")
+def mock_api_clients(make_alert):
+    """Fixture to create mock API clients with predefined data."""
+    # Mock data for alerts (trusted, so built without validation)
+    mock_alerts = AlertList.model_construct(
+        alerts=(
+            make_alert(
                 id="alert1",
                 contents=[
-                    AlertContent(
-                        text="This is a test alert.", type="text", language="en"
-                    )
+                    {"text": "This is a test alert.", "type": "text", "language": "en"}
                 ],
                 date=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
                 inputType="test",
-            )
-        ]
+            ),
+        )
     )
-    alert_client.fetch_alerts.return_value = mock_alerts
+    alert_client = _StubAlertClient(mock_alerts)
 
     # Mock data for query terms
-    mock_terms = QueryTermList(
-        terms=[
-            QueryTerm(
+    mock_terms = QueryTermList.model_construct(
+        terms=(
+            QueryTerm.model_construct(
                 id=1,
                 text="test",
                 language="en",
                 keepOrder=True,
-            )
-        ]
+            ),
+        )
     )
-    terms_client.fetch_terms.return_value = mock_terms
+    terms_client = _StubTermsClient(mock_terms)
 
     return alert_client, terms_client, mock_alerts, mock_terms
 
@@ -69,8 +95,67 @@ def test_log_entry_schema(mock_api_clients):
     assert log_entry.matches[0].term_id == 1
 
     # Check that the output can be serialized to JSON and then parsed back
-    # into a valid LogEntry model
-    json_output = log_entry.model_dump_json()
-    parsed_log_entry = LogEntry.model_validate(json.loads(json_output))
+    # into a valid LogEntry model, using orjson like the production writer.
+    # model_validate_json parses the bytes in one pydantic-core pass, with no
+    # intermediate Python dict tree.
+    json_output = orjson.dumps(log_entry.model_dump(mode="json"))
+    parsed_log_entry = LogEntry.model_validate_json(json_output)
 
     assert parsed_log_entry == log_entry
+
+
+def test_serialize_log_records_dedups_payloads(mock_api_clients):
+    """
+    Test the production JSONL serialization: payloads are logged once per
+    content hash, and the per-check record references them and parses back.
+    """
+    alert_client, terms_client, mock_alerts, mock_terms = mock_api_clients
+    log_entry = find_term_matches(alert_client, terms_client)
+
+    # Reset the writer-side dedup state so the test is order-independent
+    app_utils._seen_payload_hashes.clear()
+    app_utils._alerts_json_cache = None
+    app_utils._terms_json_cache = None
+
+    # First serialization emits both payload records plus the check record
+    records = _serialize_log_records(log_entry)
+    assert len(records) == 3
+
+    payloads = {rec["kind"]: rec for rec in map(orjson.loads, records[:2])}
+    assert set(payloads) == {"alert_text", "alert_query_term"}
+
+    # The embedded payload bodies validate back into the original models
+    restored_alerts = AlertList.model_validate(payloads["alert_text"]["body"])
+    restored_terms = QueryTermList.model_validate(
+        payloads["alert_query_term"]["body"]
+    )
+    assert [a.id for a in restored_alerts.alerts] == ["alert1"]
+    assert [t.id for t in restored_terms.terms] == [1]
+
+    # The check record is valid LogEntry JSON referencing the payload hashes
+    check_record = LogEntry.model_validate_json(records[-1])
+    assert check_record.alert_text_hash == payloads["alert_text"]["hash"]
+    assert check_record.alert_query_term_hash == payloads["alert_query_term"]["hash"]
+    assert check_record.matches == log_entry.matches
+
+    # Serializing the same payloads again only emits the small check record
+    assert len(_serialize_log_records(log_entry)) == 1
+
+
+def test_log_writer_process_writes_queued_records(tmp_path, monkeypatch):
+    """Test that the writer drains queued records to disk and stops on the sentinel."""
+    target = tmp_path / "extracted_alerts.jsonl"
+    monkeypatch.setattr(log_writer, "EXTRACTED_ALERTS_LOG_FILE", target)
+
+    # A plain queue.Queue stands in for the multiprocessing queue: the writer
+    # only relies on get/get_nowait, and an in-process run keeps the test
+    # synchronous — it returns once the None sentinel is drained.
+    jsonl_queue = queue.Queue()
+    for record in (b'{"check":1}\n', b'{"check":2}\n'):
+        jsonl_queue.put(record)
+    jsonl_queue.put(None)
+
+    log_writer.log_writer_process(jsonl_queue)
+
+    lines = target.read_bytes().splitlines()
+    assert [orjson.loads(line) for line in lines] == [{"check": 1}, {"check": 2}]